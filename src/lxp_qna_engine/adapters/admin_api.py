@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import secrets
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from pydantic import BaseModel
+
+from ..application.runtime_settings import (
+    ChannelUnavailable,
+    PerformanceSettings,
+    PerformanceUpdate,
+    RuntimeSettings,
+)
+from ..infrastructure.profiling import dump_tasks, profile_cprofile, profile_in_progress, profile_sampling
+
+
+class ProfileResponse(BaseModel):
+    """프로파일링 결과 응답 모델."""
+
+    mode: str
+    seconds: float
+    report: str | None = None
+    sampling: dict | None = None
+    tasks: list[dict]
+
+
+def build_admin_router(runtime: RuntimeSettings, token: str | None = None, *, insecure: bool = False) -> APIRouter:
+    def require_token(x_admin_token: str | None = Header(default=None)) -> None:
+        # Fail closed: without a configured token the admin API is hidden unless explicitly opted in
+        if not token:
+            if insecure:
+                return
+            raise HTTPException(status_code=404)
+        if not secrets.compare_digest((x_admin_token or "").encode(), token.encode()):
+            raise HTTPException(status_code=401, detail="invalid admin token")
+
+    router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_token)])
+
+    @router.get("/settings", response_model=PerformanceSettings)
+    async def get_settings() -> PerformanceSettings:
+        """현재 적용 중인 성능 설정 조회."""
+        return runtime.snapshot()
+
+    @router.patch("/settings", response_model=PerformanceSettings)
+    async def update_settings(patch: PerformanceUpdate) -> PerformanceSettings:
+        """성능 설정 부분 변경 (재배포 없이 실행 중인 consumer/worker 에 반영)."""
+        try:
+            return await runtime.update(patch)
+        except ChannelUnavailable as e:
+            raise HTTPException(status_code=503, detail=str(e))
+
+    @router.get("/tasks")
+    async def get_tasks(limit_frames: int = Query(10, ge=1, le=100)) -> list[dict]:
+        """실행 중인 asyncio 태스크 덤프."""
+        return dump_tasks(limit_frames=limit_frames)
+
+    @router.post("/profile", response_model=ProfileResponse)
+    async def profile(
+        mode: Literal["cprofile", "sampling"] = "cprofile",
+        seconds: float = Query(5.0, gt=0, le=60),
+        limit: int = Query(50, ge=1, le=500),
+        sort: Literal["cumulative", "tottime", "calls"] = "cumulative",
+    ) -> ProfileResponse:
+        """지정 시간 동안 이벤트 루프를 프로파일링하고 태스크 덤프와 함께 반환."""
+        if profile_in_progress():
+            raise HTTPException(status_code=409, detail="profile already in progress")
+        if mode == "cprofile":
+            report = await profile_cprofile(seconds, sort=sort, limit=limit)
+            return ProfileResponse(mode=mode, seconds=seconds, report=report, tasks=dump_tasks())
+        sampling = await profile_sampling(seconds, limit=limit)
+        return ProfileResponse(mode=mode, seconds=seconds, sampling=sampling, tasks=dump_tasks())
+
+    return router
@@ -43,7 +43,7 @@ async def post_callback(cfg: Callback, env: Envelope, answer_text: str) -> None:
     }
 
     async with httpx.AsyncClient(timeout=cfg.timeout_seconds) as client:
-        for i in range(3):
+        for _ in range(cfg.max_attempts):
             r = await client.post(url, headers=headers, json=body)
             if r.status_code < 500:
                 r.raise_for_status()
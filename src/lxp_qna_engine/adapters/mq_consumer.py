@@ -24,11 +24,23 @@ async def _connect_with_retry(mq_url: str, *, max_delay: int = 30):
             delay = min(max_delay, delay * 2)
 
 
-async def consume_and_buffer(mq_url: str, exchange: str, routing_key: str, queue: str, store):
+async def consume_and_buffer(
+    mq_url: str,
+    exchange: str,
+    routing_key: str,
+    queue: str,
+    store,
+    *,
+    prefetch_count: int = 32,
+    on_channel=None,
+):
     connection = await _connect_with_retry(mq_url)
     async with connection:
         channel = await connection.channel()
-        await channel.set_qos(prefetch_count=32)
+        await channel.set_qos(prefetch_count=prefetch_count)
+        # Expose the channel so QoS can be re-applied at runtime (admin API)
+        if on_channel is not None:
+            await on_channel(channel)
         ex = await channel.declare_exchange(exchange, aio_pika.ExchangeType.TOPIC, durable=True)
         q = await channel.declare_queue(queue, durable=True)
         await q.bind(ex, routing_key)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from structlog import get_logger
+
+from ..config.settings import Settings
+
+logger = get_logger()
+
+# Floor keeps the immediate loop from busy-polling the store
+IntervalSeconds = Annotated[float, Field(ge=1, le=86_400)]
+BatchLimit = Annotated[int, Field(ge=1, le=10_000)]
+# AMQP prefetch 0 means "unlimited", i.e. no flow control, so it is not allowed
+PrefetchCount = Annotated[int, Field(ge=1, le=65_535)]
+MaxAttempts = Annotated[int, Field(ge=1, le=10)]
+TimeoutSeconds = Annotated[int, Field(ge=1, le=3600)]
+
+# Bound on set_qos so an update cannot hang on a reconnecting channel
+QOS_TIMEOUT_SECONDS = 5.0
+
+# API field -> (Settings section, attribute, env var)
+_FIELDS: dict[str, tuple[str, str, str]] = {
+    "immediate_interval_seconds": ("scheduling", "immediate_interval_seconds", "IMMEDIATE_INTERVAL_SECONDS"),
+    "batch_limit": ("scheduling", "batch_limit", "BATCH_LIMIT"),
+    "prefetch_count": ("messaging", "prefetch_count", "RABBIT_PREFETCH"),
+    "callback_max_attempts": ("callback", "max_attempts", "CALLBACK_MAX_ATTEMPTS"),
+    "callback_timeout_seconds": ("callback", "timeout_seconds", "REQUEST_TIMEOUT_SECONDS"),
+}
+
+
+class PerformanceSettings(BaseModel):
+    """런타임에 조정 가능한 성능 설정 스냅샷."""
+
+    immediate_interval_seconds: float
+    batch_limit: int
+    prefetch_count: int
+    callback_max_attempts: int
+    callback_timeout_seconds: int
+
+
+class PerformanceUpdate(BaseModel):
+    """부분 업데이트 요청 모델 (지정한 필드만 변경)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    immediate_interval_seconds: IntervalSeconds | None = None
+    batch_limit: BatchLimit | None = None
+    prefetch_count: PrefetchCount | None = None
+    callback_max_attempts: MaxAttempts | None = None
+    callback_timeout_seconds: TimeoutSeconds | None = None
+
+
+def _validate_env(cfg: Settings) -> None:
+    """Reject env-configured values outside the bounds the admin API enforces."""
+    values = {
+        name: getattr(getattr(cfg, section), attr)
+        for name, (section, attr, _) in _FIELDS.items()
+    }
+    try:
+        PerformanceUpdate(**values)
+    except ValidationError as e:
+        problems = ", ".join(
+            f"{_FIELDS[err['loc'][0]][2]}={values[err['loc'][0]]!r} ({err['msg']})"
+            for err in e.errors()
+        )
+        raise ValueError(f"invalid performance settings: {problems}") from None
+
+
+class ChannelUnavailable(RuntimeError):
+    """Consumer channel is reconnecting; broker-side settings cannot be applied."""
+
+
+class RuntimeSettings:
+    """Mutable view over the live Settings used by the consumer and workers.
+
+    Workers read their knobs from the shared Settings on every run, so an
+    update takes effect on the next batch. Prefetch is pushed to the broker
+    immediately via the consumer channel, and the immediate loop is woken
+    when its interval changes.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        _validate_env(cfg)
+        self._cfg = cfg
+        self._lock = asyncio.Lock()
+        self._channel = None
+        self._interval_changed = asyncio.Event()
+
+    async def attach_channel(self, channel) -> None:
+        # Re-apply the current prefetch: it may have been patched while connecting
+        async with self._lock:
+            await channel.set_qos(prefetch_count=self._cfg.messaging.prefetch_count)
+            self._channel = channel
+
+    def snapshot(self) -> PerformanceSettings:
+        return PerformanceSettings(**{
+            name: getattr(getattr(self._cfg, section), attr)
+            for name, (section, attr, _) in _FIELDS.items()
+        })
+
+    async def update(self, patch: PerformanceUpdate) -> PerformanceSettings:
+        changes = patch.model_dump(exclude_none=True)
+        async with self._lock:
+            current = self.snapshot()
+            merged = current.model_copy(update=changes)
+            # Apply broker-side changes first so a failure leaves Settings untouched
+            channel = self._channel
+            if merged.prefetch_count != current.prefetch_count and channel is not None:
+                if channel.is_closed:
+                    raise ChannelUnavailable("consumer channel is reconnecting, retry later")
+                try:
+                    await asyncio.wait_for(
+                        channel.set_qos(prefetch_count=merged.prefetch_count),
+                        timeout=QOS_TIMEOUT_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    raise ChannelUnavailable("consumer channel did not apply prefetch in time, retry later")
+            for name, (section, attr, _) in _FIELDS.items():
+                setattr(getattr(self._cfg, section), attr, getattr(merged, name))
+            if merged.immediate_interval_seconds != current.immediate_interval_seconds:
+                self._interval_changed.set()
+        if changes:
+            logger.info("runtime_settings.updated", **changes)
+        return merged
+
+    async def sleep_interval(self) -> None:
+        """Sleep for the immediate interval, re-timed if it is changed meanwhile."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while True:
+            self._interval_changed.clear()
+            remaining = start + self._cfg.scheduling.immediate_interval_seconds - loop.time()
+            if remaining <= 0:
+                # Always yield so callers looping on this never starve the event loop
+                await asyncio.sleep(0)
+                return
+            try:
+                await asyncio.wait_for(self._interval_changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
@@ -12,9 +12,11 @@ from fastapi import FastAPI, Request
 from pydantic import BaseModel
 from structlog import get_logger
 
+from .adapters.admin_api import build_admin_router
 from .adapters.http_callback import post_callback
 from .adapters.mq_consumer import consume_and_buffer
 from .application.llm_answer import generate_answer
+from .application.runtime_settings import RuntimeSettings
 from .application.scheduling import build_scheduler, add_cron_jobs
 from .config.settings import Settings
 from .infrastructure.store_sqlite import Store
@@ -47,7 +49,7 @@ class InfoResponse(BaseModel):
 
 
 async def process_pending(store: Store, cfg: Settings):
-    pending = await store.load_unprocessed(limit=200)
+    pending = await store.load_unprocessed(limit=cfg.scheduling.batch_limit)
     for env in pending:
         try:
             answer = generate_answer(cfg.llm, env)
@@ -59,8 +61,9 @@ async def process_pending(store: Store, cfg: Settings):
             logger.error("failed", eventId=env.eventId, qnaId=env.payload.qna.id, error=str(e))
 
 
-async def main_async():
-    cfg = Settings()
+async def main_async(cfg: Settings | None = None, runtime: RuntimeSettings | None = None):
+    cfg = cfg or Settings()
+    runtime = runtime or RuntimeSettings(cfg)
     logging.basicConfig(level=getattr(logging, cfg.log_level.upper(), logging.INFO))
 
     db_dsn = os.getenv("DB_DSN", "sqlite+pysqlite:///./qna.db")
@@ -74,11 +77,15 @@ async def main_async():
         cron_1=cfg.scheduling.cron_1,
         cron_2=cfg.scheduling.cron_2,
         timezone=cfg.scheduling.timezone,
+        immediate_interval_seconds=cfg.scheduling.immediate_interval_seconds,
+        batch_limit=cfg.scheduling.batch_limit,
         mq_url=cfg.messaging.url,
         mq_exchange=cfg.messaging.exchange,
         mq_routing_key=cfg.messaging.routing_key,
         mq_queue=cfg.messaging.queue,
+        mq_prefetch=cfg.messaging.prefetch_count,
         callback_base=cfg.callback.base,
+        callback_max_attempts=cfg.callback.max_attempts,
         llm_provider=cfg.llm.provider,
         llm_model=cfg.llm.model,
         llm_temperature=cfg.llm.temperature,
@@ -99,17 +106,19 @@ async def main_async():
             cfg.messaging.routing_key,
             cfg.messaging.queue,
             store,
+            prefetch_count=cfg.messaging.prefetch_count,
+            on_channel=runtime.attach_channel,
         )
     ))
 
     # Optional immediate processing loop
     if cfg.scheduling.immediate:
-        logger.info("immediate_loop.enabled", interval_seconds=5)
+        logger.info("immediate_loop.enabled", interval_seconds=cfg.scheduling.immediate_interval_seconds)
 
         async def immediate_loop():
             while True:
                 await process_pending(store, cfg)
-                await asyncio.sleep(5)
+                await runtime.sleep_interval()
 
         tasks.append(asyncio.create_task(immediate_loop()))
 
@@ -123,10 +132,16 @@ def main():
 
 def app():  # uvicorn --factory
     uvloop.install()
+    cfg = Settings()
+    runtime = RuntimeSettings(cfg)
     loop = asyncio.get_event_loop()
-    loop.create_task(main_async())
+    loop.create_task(main_async(cfg, runtime))
 
     f = FastAPI()
+    if cfg.admin.token or cfg.admin.insecure:
+        f.include_router(build_admin_router(runtime, cfg.admin.token, insecure=cfg.admin.insecure))
+    else:
+        logger.info("admin.disabled", reason="ADMIN_TOKEN not set")
     # record process start time (timezone-aware)
     f.state.start_time = datetime.now(timezone.utc)
 
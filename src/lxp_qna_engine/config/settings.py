@@ -12,6 +12,7 @@ class Messaging:
     exchange: str = os.getenv("RABBIT_EXCHANGE", "content.events")
     routing_key: str = os.getenv("RABBIT_ROUTING_KEY", "qna.created")
     queue: str = os.getenv("RABBIT_QUEUE", "lxp-qna-engine.qna-created")
+    prefetch_count: int = int(os.getenv("RABBIT_PREFETCH", "32"))
 
 
 @dataclass
@@ -20,12 +21,16 @@ class Scheduling:
     cron_2: str = os.getenv("CRON_2", "0 18 * * *")
     timezone: str = os.getenv("TIMEZONE", "Asia/Seoul")
     immediate: bool = os.getenv("IMMEDIATE_PROCESS", "false").lower() == "true"
+    immediate_interval_seconds: float = float(os.getenv("IMMEDIATE_INTERVAL_SECONDS", "5"))
+    batch_limit: int = int(os.getenv("BATCH_LIMIT", "200"))
 
 
 @dataclass
 class Callback:
     base: str = os.getenv("QNA_CALLBACK_BASE", "http://localhost:8080/api-v1/qna")
     timeout_seconds: int = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "30"))
+    # Total POST attempts per callback (not retries on top of the first)
+    max_attempts: int = int(os.getenv("CALLBACK_MAX_ATTEMPTS", "3"))
 
 
 @dataclass
@@ -38,10 +43,19 @@ class LLM:
     max_tokens: int = int(os.getenv("LLM_MAX_TOKENS", "512"))
 
 
+@dataclass
+class Admin:
+    # /admin endpoints require a matching X-Admin-Token header; disabled when unset
+    token: str | None = os.getenv("ADMIN_TOKEN") or None
+    # Local-only opt-in: expose /admin without a token
+    insecure: bool = os.getenv("ADMIN_INSECURE", "false").lower() == "true"
+
+
 @dataclass
 class Settings:
     messaging: Messaging = field(default_factory=Messaging)
     scheduling: Scheduling = field(default_factory=Scheduling)
     callback: Callback = field(default_factory=Callback)
     llm: LLM = field(default_factory=LLM)
+    admin: Admin = field(default_factory=Admin)
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
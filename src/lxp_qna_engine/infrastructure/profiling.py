@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from collections import Counter
+
+# Only one profile may run at a time: cProfile cannot be nested on a thread.
+_profile_lock = asyncio.Lock()
+
+
+def profile_in_progress() -> bool:
+    return _profile_lock.locked()
+
+
+async def profile_cprofile(seconds: float, *, sort: str = "cumulative", limit: int = 50) -> str:
+    """Deterministic profile of the event loop thread for `seconds`."""
+    async with _profile_lock:
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            prof.disable()
+    out = io.StringIO()
+    pstats.Stats(prof, stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def _collapse(frame) -> str:
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+async def profile_sampling(seconds: float, *, interval: float = 0.005, limit: int = 50) -> dict:
+    """Statistical profile of the event loop thread, sampled from a helper thread.
+
+    Returns the most frequent stacks in collapsed (flamegraph) format.
+    """
+    async with _profile_lock:
+        target = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        stop = threading.Event()
+
+        def sample() -> None:
+            while not stop.wait(interval):
+                frame = sys._current_frames().get(target)
+                if frame is not None:
+                    stacks[_collapse(frame)] += 1
+
+        sampler = threading.Thread(target=sample, name="profile-sampler", daemon=True)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stop.set()
+            await asyncio.to_thread(sampler.join)
+    return {
+        "samples": sum(stacks.values()),
+        "interval_seconds": interval,
+        "stacks": [{"stack": s, "count": n} for s, n in stacks.most_common(limit)],
+    }
+
+
+def dump_tasks(*, limit_frames: int = 10) -> list[dict]:
+    """Snapshot of all asyncio tasks on the running loop with their current stacks."""
+    current = asyncio.current_task()
+    tasks = []
+    for t in asyncio.all_tasks():
+        coro = t.get_coro()
+        stack = io.StringIO()
+        t.print_stack(limit=limit_frames, file=stack)
+        tasks.append({
+            "name": t.get_name(),
+            "coro": getattr(coro, "__qualname__", repr(coro)),
+            "done": t.done(),
+            "cancelled": t.cancelled(),
+            "current": t is current,
+            "stack": stack.getvalue(),
+        })
+    return sorted(tasks, key=lambda x: x["name"])
@@ -1,6 +1,9 @@
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 # Ensure `src` is on sys.path for tests without installing the package
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -9,3 +12,23 @@ if str(SRC) not in sys.path:
 
 # Ensure pytest-asyncio plugin is loaded
 pytest_plugins = ("pytest_asyncio",)
+
+
+@pytest.fixture
+def make_env():
+    """Factory for a minimal QnA-created envelope."""
+    from lxp_qna_engine.domain.models import Envelope, QnaCreatedPayload, Course, Section, Lecture, Qna
+
+    def _make(qid="qna-1", eid="evt-123"):
+        return Envelope(
+            eventId=eid,
+            occurredAt=datetime.now(timezone.utc),
+            payload=QnaCreatedPayload(
+                course=Course(uuid="c-1", title="파이썬"),
+                section=Section(uuid="s-1", title="기초"),
+                lecture=Lecture(uuid="l-1", title="변수"),
+                qna=Qna(id=qid, authorId="u-1", title="질문", content="내용", createdAt=datetime.now(timezone.utc)),
+            ),
+        )
+
+    return _make
@@ -0,0 +1,93 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from lxp_qna_engine.adapters.admin_api import build_admin_router
+from lxp_qna_engine.application.runtime_settings import RuntimeSettings
+from lxp_qna_engine.config.settings import Settings
+
+TOKEN = "s3cret"
+
+
+def make_client(token=TOKEN, *, insecure=False):
+    cfg = Settings()
+    f = FastAPI()
+    f.include_router(build_admin_router(RuntimeSettings(cfg), token, insecure=insecure))
+    return TestClient(f), cfg
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_rejects_missing_or_wrong_token(headers):
+    client, _ = make_client()
+    assert client.get("/admin/settings", headers=headers).status_code == 401
+
+
+def test_accepts_correct_token():
+    client, cfg = make_client()
+    r = client.get("/admin/settings", headers={"X-Admin-Token": TOKEN})
+    assert r.status_code == 200
+    assert r.json()["batch_limit"] == cfg.scheduling.batch_limit
+
+
+@pytest.mark.parametrize("token", [None, ""])
+def test_fails_closed_without_token(token):
+    client, _ = make_client(token)
+    assert client.get("/admin/settings").status_code == 404
+    assert client.post("/admin/profile", params={"seconds": 0.01}).status_code == 404
+
+
+def test_non_ascii_header_is_unauthorized_not_error():
+    client, _ = make_client()
+    r = client.get("/admin/settings", headers={"X-Admin-Token": "토큰".encode()})
+    assert r.status_code == 401
+
+
+def test_non_ascii_configured_token_does_not_error():
+    client, _ = make_client("토큰")
+    assert client.get("/admin/settings", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+
+def test_insecure_opt_in_allows_without_token():
+    client, _ = make_client(None, insecure=True)
+    assert client.get("/admin/settings").status_code == 200
+
+
+def test_patch_updates_settings_and_validates():
+    client, cfg = make_client()
+    headers = {"X-Admin-Token": TOKEN}
+
+    r = client.patch("/admin/settings", headers=headers, json={"batch_limit": 7})
+    assert r.status_code == 200
+    assert r.json()["batch_limit"] == 7
+    assert cfg.scheduling.batch_limit == 7
+
+    assert client.patch("/admin/settings", headers=headers, json={"batch_limit": 0}).status_code == 422
+
+
+def test_tasks_dump():
+    client, _ = make_client()
+    r = client.get("/admin/tasks", headers={"X-Admin-Token": TOKEN})
+    assert r.status_code == 200
+    assert any(t["current"] for t in r.json())
+
+
+@pytest.mark.parametrize("mode,field", [("cprofile", "report"), ("sampling", "sampling")])
+def test_profile_modes(mode, field):
+    client, _ = make_client()
+    r = client.post(
+        "/admin/profile",
+        headers={"X-Admin-Token": TOKEN},
+        params={"mode": mode, "seconds": 0.05},
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert body["mode"] == mode
+    assert body[field]
+    assert body["tasks"]
+
+
+def test_profile_conflict_when_already_running(monkeypatch):
+    monkeypatch.setattr("lxp_qna_engine.adapters.admin_api.profile_in_progress", lambda: True)
+    client, _ = make_client()
+    r = client.post("/admin/profile", headers={"X-Admin-Token": TOKEN}, params={"seconds": 0.05})
+    assert r.status_code == 409
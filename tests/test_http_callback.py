@@ -0,0 +1,36 @@
+import httpx
+import pytest
+
+from lxp_qna_engine.adapters.http_callback import post_callback
+from lxp_qna_engine.config.settings import Callback
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_attempts", [1, 3, 5])
+async def test_post_callback_honours_max_attempts(monkeypatch, make_env, max_attempts):
+    calls = {"n": 0}
+
+    class R:
+        status_code = 503
+
+        def raise_for_status(self):
+            raise httpx.HTTPStatusError("503", request=None, response=None)
+
+    async def fake_post(url, headers=None, json=None):
+        calls["n"] += 1
+        return R()
+
+    class FakeClient:
+        async def __aenter__(self): return self
+
+        async def __aexit__(self, *a): return False
+
+        post = staticmethod(fake_post)
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda timeout: FakeClient())
+
+    cfg = Callback(base="http://example.com/api-v1/qna", timeout_seconds=5, max_attempts=max_attempts)
+    with pytest.raises(httpx.HTTPStatusError):
+        await post_callback(cfg, make_env(), "OK")
+
+    assert calls["n"] == max_attempts
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from lxp_qna_engine.application.runtime_settings import ChannelUnavailable, PerformanceUpdate, RuntimeSettings
+from lxp_qna_engine.config.settings import Settings
+
+
+class FakeChannel:
+    is_closed = False
+
+    def __init__(self, hang=False):
+        self.qos = []
+        self.hang = hang
+
+    async def set_qos(self, prefetch_count):
+        if self.hang:
+            await asyncio.Event().wait()
+        self.qos.append(prefetch_count)
+
+
+@pytest.mark.asyncio
+async def test_update_applies_to_live_settings_and_channel():
+    cfg = Settings()
+    runtime = RuntimeSettings(cfg)
+    channel = FakeChannel()
+    await runtime.attach_channel(channel)
+    channel.qos.clear()
+
+    snap = await runtime.update(PerformanceUpdate(batch_limit=10, prefetch_count=4, callback_max_attempts=5))
+
+    assert snap.batch_limit == 10
+    assert cfg.scheduling.batch_limit == 10
+    assert cfg.messaging.prefetch_count == 4
+    assert cfg.callback.max_attempts == 5
+    assert channel.qos == [4]
+    # untouched knobs keep their values
+    assert snap.immediate_interval_seconds == cfg.scheduling.immediate_interval_seconds
+
+
+def test_update_rejects_invalid_values():
+    with pytest.raises(ValidationError):
+        PerformanceUpdate(batch_limit=0)
+    with pytest.raises(ValidationError):
+        PerformanceUpdate(unknown=1)
+    with pytest.raises(ValidationError):
+        PerformanceUpdate(prefetch_count=0)
+    with pytest.raises(ValidationError):
+        PerformanceUpdate(immediate_interval_seconds=1e-9)
+
+
+@pytest.mark.asyncio
+async def test_attach_channel_applies_prefetch_patched_while_connecting():
+    cfg = Settings()
+    runtime = RuntimeSettings(cfg)
+    await runtime.update(PerformanceUpdate(prefetch_count=7))
+
+    channel = FakeChannel()
+    await runtime.attach_channel(channel)
+
+    assert channel.qos == [7]
+
+
+@pytest.mark.asyncio
+async def test_update_rejects_prefetch_while_channel_reconnecting():
+    cfg = Settings()
+    runtime = RuntimeSettings(cfg)
+    channel = FakeChannel()
+    await runtime.attach_channel(channel)
+    channel.is_closed = True
+    before = cfg.messaging.prefetch_count
+
+    with pytest.raises(ChannelUnavailable):
+        await runtime.update(PerformanceUpdate(prefetch_count=before + 1, batch_limit=3))
+
+    assert cfg.messaging.prefetch_count == before
+    assert cfg.scheduling.batch_limit != 3
+
+
+@pytest.mark.asyncio
+async def test_update_times_out_when_set_qos_hangs(monkeypatch):
+    monkeypatch.setattr("lxp_qna_engine.application.runtime_settings.QOS_TIMEOUT_SECONDS", 0.01)
+    cfg = Settings()
+    runtime = RuntimeSettings(cfg)
+    await runtime.attach_channel(FakeChannel())
+    runtime._channel.hang = True
+    before = cfg.messaging.prefetch_count
+
+    with pytest.raises(ChannelUnavailable):
+        await runtime.update(PerformanceUpdate(prefetch_count=before + 1))
+
+    assert cfg.messaging.prefetch_count == before
+    # lock is released: later updates still go through
+    assert (await runtime.update(PerformanceUpdate(batch_limit=5))).batch_limit == 5
+
+
+@pytest.mark.parametrize(
+    "section,attr,value,env",
+    [
+        ("scheduling", "immediate_interval_seconds", 0, "IMMEDIATE_INTERVAL_SECONDS"),
+        ("messaging", "prefetch_count", 0, "RABBIT_PREFETCH"),
+        ("callback", "max_attempts", 0, "CALLBACK_MAX_ATTEMPTS"),
+    ],
+)
+def test_rejects_out_of_bounds_env_values_at_startup(section, attr, value, env):
+    cfg = Settings()
+    setattr(getattr(cfg, section), attr, value)
+
+    with pytest.raises(ValueError, match=env):
+        RuntimeSettings(cfg)
+
+
+@pytest.mark.asyncio
+async def test_sleep_interval_always_yields():
+    cfg = Settings()
+    runtime = RuntimeSettings(cfg)
+    cfg.scheduling.immediate_interval_seconds = 0
+    ticks = {"n": 0}
+
+    async def ticker():
+        while True:
+            ticks["n"] += 1
+            await asyncio.sleep(0)
+
+    t = asyncio.create_task(ticker())
+    for _ in range(10):
+        await runtime.sleep_interval()
+    t.cancel()
+
+    assert ticks["n"] > 0
+
+
+@pytest.mark.asyncio
+async def test_sleep_interval_wakes_when_interval_lowered():
+    cfg = Settings()
+    cfg.scheduling.immediate_interval_seconds = 3600
+    runtime = RuntimeSettings(cfg)
+
+    sleeper = asyncio.create_task(runtime.sleep_interval())
+    await asyncio.sleep(0)
+    await runtime.update(PerformanceUpdate(immediate_interval_seconds=1))
+
+    await asyncio.wait_for(sleeper, timeout=3)